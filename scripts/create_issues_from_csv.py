@@ -1,58 +1,266 @@
 #!/usr/bin/env python3
+import concurrent.futures
 import csv
 import datetime as dt
+import hashlib
+import http.client
 import json
 import os
 import subprocess
 import sys
-from typing import List, Dict, Optional
+import threading
+import time
+import urllib.parse
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+API_HOST = "api.github.com"
+MAX_REDIRECTS = 3
+MAX_THROTTLE_RETRIES = 3
+SECONDARY_RATE_LIMIT_WAIT = 60.0
+
+
+class GitHubError(RuntimeError):
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class QueryTooLargeError(GitHubError):
+    pass
+
+
+class GH:
+    """Minimal GitHub REST client that keeps one HTTPS connection alive per thread."""
+
+    def __init__(self, token: str, repo: str) -> None:
+        self.repo = repo
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": "jalm-create-issues",
+        }
+        self._local = threading.local()
+        self._rate_lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def _conn(self) -> http.client.HTTPSConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPSConnection(API_HOST, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _drop_conn(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def _wait_for_rate_limit(self) -> None:
+        with self._rate_lock:
+            delay = self._resume_at - time.time()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _record_rate_limit(self, resp: http.client.HTTPResponse) -> None:
+        remaining = resp.getheader("X-RateLimit-Remaining")
+        reset = resp.getheader("X-RateLimit-Reset")
+        if remaining == "0" and reset:
+            with self._rate_lock:
+                self._resume_at = max(self._resume_at, float(reset) + 1)
+
+    def _send(
+        self, method: str, path: str, payload: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[http.client.HTTPResponse, bytes]:
+        self._wait_for_rate_limit()
+        for attempt in range(2):
+            conn = self._conn()
+            sent = False
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                raw = resp.read()
+                break
+            except (http.client.HTTPException, OSError):
+                # The server may have closed an idle keep-alive connection; reconnect once.
+                # Once a non-GET request has gone out GitHub may already have acted on it,
+                # so retrying could create a duplicate issue or comment.
+                self._drop_conn()
+                if attempt or (sent and method != "GET"):
+                    raise
+        self._record_rate_limit(resp)
+        return resp, raw
+
+    def request(self, method: str, path: str, body: Optional[dict] = None) -> Tuple[object, http.client.HTTPResponse]:
+        payload = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = dict(self.headers)
+        if payload is not None:
+            headers["Content-Type"] = "application/json"
+
+        redirects = 0
+        throttled = 0
+        while True:
+            resp, raw = self._send(method, path, payload, headers)
+            # GitHub redirects requests for renamed or transferred repositories.
+            # 307/308 keep the method and body, so they are safe to follow for writes too.
+            if (
+                resp.status in (301, 302, 307, 308)
+                and (method == "GET" or resp.status in (307, 308))
+                and redirects < MAX_REDIRECTS
+            ):
+                redirects += 1
+                path = redirect_path(resp.getheader("Location"))
+                continue
+            data = decode_json(resp, raw)
+            # A rate-limited request was rejected before GitHub acted on it, so
+            # retrying is safe even for writes. Pause every worker, not just this one.
+            delay = throttle_delay(resp, data)
+            if delay is not None and throttled < MAX_THROTTLE_RETRIES:
+                throttled += 1
+                with self._rate_lock:
+                    self._resume_at = max(self._resume_at, time.time() + delay)
+                continue
+            break
+
+        if not 200 <= resp.status < 300:
+            message = data.get("message") if isinstance(data, dict) else None
+            raise GitHubError(f"{method} {path} failed ({resp.status}): {message or resp.reason}", resp.status)
+        if raw and data is None:
+            raise GitHubError(f"{method} {path} returned a non-JSON response", resp.status)
+        return data, resp
+
+    def paginate(self, path: str) -> Iterator[dict]:
+        # Yield items page by page over the same connection instead of collecting every page first.
+        next_path: Optional[str] = path
+        while next_path:
+            data, resp = self.request("GET", next_path)
+            yield from data
+            next_path = next_page(resp.getheader("Link"))
+
+
+def decode_json(resp: http.client.HTTPResponse, raw: bytes) -> object:
+    # Gateway errors (502/504) and 413s often carry an HTML or empty body.
+    if not raw or "json" not in (resp.getheader("Content-Type") or ""):
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def throttle_delay(resp: http.client.HTTPResponse, data: object) -> Optional[float]:
+    """Return how long to wait before retrying a rate-limited reply, or None if it was not rate-limited."""
+    if resp.status not in (403, 429):
+        return None
+    retry_after = resp.getheader("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    reset = resp.getheader("X-RateLimit-Reset")
+    if resp.getheader("X-RateLimit-Remaining") == "0" and reset:
+        return max(0.0, float(reset) - time.time()) + 1
+    message = data.get("message", "") if isinstance(data, dict) else ""
+    if resp.status == 429 or "secondary rate limit" in message.lower():
+        # GitHub asks clients to wait at least a minute when no header says how long.
+        return SECONDARY_RATE_LIMIT_WAIT
+    return None
 
 
-def run_gh(args: List[str], input_text: Optional[str] = None) -> str:
-    proc = subprocess.run(
-        ["gh"] + args,
-        input=input_text,
-        text=True,
-        capture_output=True,
-    )
+def redirect_path(location: Optional[str]) -> str:
+    parts = urllib.parse.urlsplit(location or "")
+    if not parts.path or parts.netloc not in ("", API_HOST):
+        raise GitHubError(f"Unexpected redirect to {location!r}")
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+def next_page(link_header: Optional[str]) -> Optional[str]:
+    if not link_header:
+        return None
+    for part in link_header.split(","):
+        url, _, rel = part.partition(";")
+        if 'rel="next"' in rel:
+            parts = urllib.parse.urlsplit(url.strip().strip("<>"))
+            return f"{parts.path}?{parts.query}" if parts.query else parts.path
+    return None
+
+
+def resolve_repo() -> str:
+    repo = os.environ.get("GITHUB_REPOSITORY")
+    if repo:
+        return repo
+    proc = subprocess.run(["git", "remote", "get-url", "origin"], text=True, capture_output=True)
+    if proc.returncode != 0:
+        raise RuntimeError("Set GITHUB_REPOSITORY=owner/repo or run inside a clone with an origin remote")
+    url = proc.stdout.strip()
+    if url.endswith(".git"):
+        url = url[: -len(".git")]
+    # Handles both https://github.com/owner/repo and git@github.com:owner/repo.
+    owner, repo = url.replace(":", "/").split("/")[-2:]
+    return f"{owner}/{repo}"
+
+
+def resolve_token() -> Optional[str]:
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    # Reuse an existing gh login, but ask gh only once for the whole run.
+    try:
+        proc = subprocess.run(["gh", "auth", "token"], text=True, capture_output=True)
+    except FileNotFoundError:
+        return None
     if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or proc.stdout.strip() or "gh command failed")
-    return proc.stdout
+        return None
+    return proc.stdout.strip() or None
 
 
-def load_labels() -> set:
-    out = run_gh(["label", "list", "--json", "name"])
-    data = json.loads(out)
-    return {item["name"] for item in data}
+def load_labels(gh: GH) -> set:
+    return {item["name"] for item in gh.paginate(f"/repos/{gh.repo}/labels?per_page=100")}
 
 
-def ensure_label(name: str, description: str, existing: set) -> None:
-    if name in existing:
+def create_label(gh: GH, name: str, description: str) -> None:
+    gh.request("POST", f"/repos/{gh.repo}/labels", {"name": name, "description": description})
+
+
+def ensure_labels(gh: GH, label_descriptions: Dict[str, str], existing: set) -> None:
+    missing = [name for name in label_descriptions if name not in existing]
+    if not missing:
         return
-    run_gh(["label", "create", name, "--description", description])
-    existing.add(name)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(missing)) as ex:
+        futures = [ex.submit(create_label, gh, name, label_descriptions[name]) for name in missing]
+        for future in futures:
+            future.result()
+    existing.update(missing)
+
+
+LABEL_RULES = [
+    ("spec", ["spec", "syntax", "grammar", "semantics", "language design", "proposal"]),
+    ("compiler", ["compiler", "parser", "frontend", "backend", "codegen", "typecheck", "type checker", "optimizer"]),
+    ("runtime", ["runtime", "vm", "jit", "gc", "garbage collector", "scheduler", "interpreter"]),
+    ("stdlib", ["stdlib", "standard library", "library", "collections", "io", "fs", "net"]),
+    ("tooling", ["tooling", "cli", "lsp", "formatter", "linter", "debugger", "ide", "build tool"]),
+    ("docs", ["docs", "documentation", "guide", "tutorial", "reference", "readme", "examples"]),
+    ("infra", ["infra", "ci", "cd", "pipeline", "release", "packaging", "docker", "k8s", "deployment"]),
+]
+
+NOTE_RULES = [
+    ("Potential breaking change; confirm migration path", ["breaking", "migration", "deprecate"]),
+    ("Review security implications and threat model", ["security", "auth", "secret"]),
+    ("Track performance impact before and after", ["perf", "performance", "latency"]),
+]
 
 
 def classify_label(title: str, body: str) -> str:
     text = f"{title}\n{body}".lower()
-    rules = [
-        ("spec", ["spec", "syntax", "grammar", "semantics", "language design", "proposal"]),
-        ("compiler", ["compiler", "parser", "frontend", "backend", "codegen", "typecheck", "type checker", "optimizer"]),
-        ("runtime", ["runtime", "vm", "jit", "gc", "garbage collector", "scheduler", "interpreter"]),
-        ("stdlib", ["stdlib", "standard library", "library", "collections", "io", "fs", "net"]),
-        ("tooling", ["tooling", "cli", "lsp", "formatter", "linter", "debugger", "ide", "build tool"]),
-        ("docs", ["docs", "documentation", "guide", "tutorial", "reference", "readme", "examples"]),
-        ("infra", ["infra", "ci", "cd", "pipeline", "release", "packaging", "docker", "k8s", "deployment"]),
-    ]
-    for label, keywords in rules:
+    for label, keywords in LABEL_RULES:
         if any(k in text for k in keywords):
             return label
     return "tooling"
 
 
-def generate_subtasks(title: str, body: str, label: str) -> List[str]:
-    base = [
-        f"Review existing context and constraints for: {title}",
+def build_subtasks(label: str) -> Tuple[str, ...]:
+    # Everything after the title-specific first step depends only on the label.
+    steps = [
         "Define functional and non-functional requirements",
         "Design the approach and document key decisions",
         "Implement the core changes in a minimal, testable slice",
@@ -61,15 +269,14 @@ def generate_subtasks(title: str, body: str, label: str) -> List[str]:
         "Run relevant checks locally and fix regressions",
     ]
     if label in {"compiler", "runtime"}:
-        base.insert(4, "Add targeted benchmarks or perf checks for hot paths")
+        steps.insert(3, "Add targeted benchmarks or perf checks for hot paths")
     if label == "infra":
-        base.insert(4, "Validate changes in CI-like environment")
-    return base[:12]
+        steps.insert(3, "Validate changes in CI-like environment")
+    return tuple(steps[:11])
 
 
-def generate_acceptance(title: str, label: str) -> List[str]:
+def build_acceptance(label: str) -> Tuple[str, ...]:
     checks = [
-        f"Behavior matches the goal described for: {title}",
         "All new/updated tests pass locally",
         "No regressions in existing functionality are observed",
         "Docs/examples accurately describe the new behavior",
@@ -77,76 +284,199 @@ def generate_acceptance(title: str, label: str) -> List[str]:
         "Code changes are reviewed and ready to merge",
     ]
     if label in {"compiler", "runtime"}:
-        checks.insert(3, "Performance impact is measured and acceptable")
+        checks.insert(2, "Performance impact is measured and acceptable")
     if label == "infra":
-        checks.insert(3, "CI/release pipeline runs successfully with changes")
-    return checks[:10]
+        checks.insert(2, "CI/release pipeline runs successfully with changes")
+    return tuple(checks[:9])
+
+
+ALL_LABELS = [label for label, _ in LABEL_RULES]
+SUBTASKS_BY_LABEL = {label: "\n- ".join(build_subtasks(label)) for label in ALL_LABELS}
+ACCEPTANCE_BY_LABEL = {label: "\n- ".join(build_acceptance(label)) for label in ALL_LABELS}
+
+
+def generate_subtasks(title: str, body: str, label: str) -> str:
+    return f"- Review existing context and constraints for: {title}\n- " + SUBTASKS_BY_LABEL[label]
+
+
+def generate_acceptance(title: str, label: str) -> str:
+    return f"- Behavior matches the goal described for: {title}\n- " + ACCEPTANCE_BY_LABEL[label]
 
 
 def generate_notes(body: str) -> Optional[List[str]]:
     text = body.lower()
-    notes = []
-    if any(k in text for k in ["breaking", "migration", "deprecate"]):
-        notes.append("Potential breaking change; confirm migration path")
-    if any(k in text for k in ["security", "auth", "secret"]):
-        notes.append("Review security implications and threat model")
-    if any(k in text for k in ["perf", "performance", "latency"]):
-        notes.append("Track performance impact before and after")
+    notes = [note for note, keywords in NOTE_RULES if any(k in text for k in keywords)]
     return notes or None
 
 
 def expand_body(csv_body: str, title: str, label: str) -> str:
     base = (csv_body or "").strip()
-    subtasks = generate_subtasks(title, base, label)
-    acceptance = generate_acceptance(title, label)
     notes = generate_notes(base)
 
-    parts = []
-    if base:
-        parts.append(base)
-        parts.append("**Goal**\n" + base)
-    else:
-        parts.append("**Goal**\nTBD")
-    parts.append("**Subtasks**\n" + "\n".join(f"- {s}" for s in subtasks))
-    parts.append("**Acceptance criteria**\n" + "\n".join(f"- {c}" for c in acceptance))
+    parts = [
+        "**Goal**\n" + (base or "TBD"),
+        "**Subtasks**\n" + generate_subtasks(title, base, label),
+        "**Acceptance criteria**\n" + generate_acceptance(title, label),
+    ]
     if notes:
-        parts.append("**Notes**\n" + "\n".join(f"- {n}" for n in notes))
+        parts.append("**Notes**\n- " + "\n- ".join(notes))
     return "\n\n".join(parts).strip() + "\n"
 
 
-def find_existing_issue(title: str) -> Optional[Dict[str, str]]:
-    search = f'"{title}" in:title'
-    out = run_gh(["issue", "list", "--state", "all", "--search", search, "--json", "number,title,url"])
-    data = json.loads(out)
-    for item in data:
-        if item.get("title") == title:
-            return item
-    return None
+SEARCH_CHUNK_SIZE = 50
+# Titles often share words, so scan as many hits as `gh issue list --search` did before matching exactly.
+SEARCH_RESULTS_PER_TITLE = 30
+
+
+# Errors GitHub reports when a GraphQL document is too big or too costly to run.
+QUERY_SIZE_ERROR_TYPES = {"MAX_NODE_LIMIT_EXCEEDED", "RESOURCE_LIMITS_EXCEEDED"}
+QUERY_SIZE_HTTP_STATUSES = {413, 502, 504}
+
+
+def search_issue_chunk(gh: GH, titles: List[str]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+    params = ", ".join(f"$q{i}: String!" for i in range(len(titles)))
+    fields = " ".join(
+        f"s{i}: search(query: $q{i}, type: ISSUE, first: {SEARCH_RESULTS_PER_TITLE}) "
+        "{ nodes { ... on Issue { number title url } } }"
+        for i in range(len(titles))
+    )
+    # Search cannot escape quotes inside a phrase; results are matched exactly below anyway.
+    variables = {
+        f"q{i}": 'repo:{} is:issue in:title "{}"'.format(gh.repo, title.replace('"', " "))
+        for i, title in enumerate(titles)
+    }
+    try:
+        data, _ = gh.request("POST", "/graphql", {"query": f"query({params}) {{ {fields} }}", "variables": variables})
+    except GitHubError as exc:
+        if exc.status in QUERY_SIZE_HTTP_STATUSES:
+            raise QueryTooLargeError(str(exc), exc.status) from exc
+        raise
+
+    # Errors carrying a path belong to a single alias (e.g. an overlong search
+    # query) and only fail that title; anything else fails the whole document.
+    failed = {}
+    for err in data.get("errors") or []:
+        path = err.get("path") or []
+        alias = path[0] if path else None
+        if isinstance(alias, str) and alias.startswith("s") and alias[1:].isdigit() and int(alias[1:]) < len(titles):
+            failed[titles[int(alias[1:])]] = err.get("message", "search failed")
+        elif err.get("type") in QUERY_SIZE_ERROR_TYPES:
+            raise QueryTooLargeError(f"GraphQL search failed: {err.get('message')}")
+        else:
+            raise GitHubError(f"GraphQL search failed: {err.get('message')}")
+
+    found = {}
+    results = data.get("data") or {}
+    for i, title in enumerate(titles):
+        if title in failed:
+            continue
+        result = results.get(f"s{i}")
+        if result is None:
+            failed[title] = "search returned no data"
+            continue
+        for node in result["nodes"]:
+            if node.get("title") == title:
+                found[title] = node
+                break
+    return found, failed
+
+
+def search_issues(gh: GH, titles: List[str]) -> Tuple[Dict[str, Dict[str, str]], Dict[str, str]]:
+    """Return exact-title matches and, separately, the titles whose lookup failed."""
+    titles = list(dict.fromkeys(titles))
+    if not titles:
+        return {}, {}
+    try:
+        return search_issue_chunk(gh, titles)
+    except QueryTooLargeError:
+        if len(titles) <= SEARCH_CHUNK_SIZE:
+            raise
+    found = {}
+    failed = {}
+    for i in range(0, len(titles), SEARCH_CHUNK_SIZE):
+        chunk_found, chunk_failed = search_issue_chunk(gh, titles[i : i + SEARCH_CHUNK_SIZE])
+        found.update(chunk_found)
+        failed.update(chunk_failed)
+    return found, failed
+
 
+def find_existing_issue(title: str, existing_by_title: Dict[str, Dict[str, str]]) -> Optional[Dict[str, str]]:
+    return existing_by_title.get(title)
 
-def read_csv(path: str) -> List[Dict[str, str]]:
+
+def read_csv(path: str) -> List[Tuple[str, str]]:
     rows = []
     with open(path, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, [])
+        ti = header.index("Title") if "Title" in header else None
+        bi = header.index("Body") if "Body" in header else None
+        if ti is None:
+            return rows
         for row in reader:
-            title = (row.get("Title") or "").strip()
-            body = (row.get("Body") or "").strip()
+            title = row[ti].strip() if ti < len(row) else ""
             if not title:
                 continue
-            rows.append({"title": title, "body": body})
+            body = row[bi].strip() if bi is not None and bi < len(row) else ""
+            rows.append((title, body))
     return rows
 
 
+INDEX_PATH = "artifacts/issue_index.json"
+# Replies meaning an indexed issue is no longer in the repository (moved, deleted, or gone).
+STALE_ISSUE_STATUSES = {301, 404, 410}
+
+
+def row_key(title: str, body: str) -> str:
+    return hashlib.sha256(f"{title}\n{body}".encode("utf-8")).hexdigest()
+
+
+def load_index(path: str) -> Dict[str, Dict[str, Dict[str, object]]]:
+    # Entries are grouped by "owner/repo" so state from one repository is never
+    # reused when importing into another.
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        print(f"Ignoring unreadable issue index: {path}", file=sys.stderr)
+        return {}
+    if not isinstance(data, dict):
+        print(f"Ignoring unreadable issue index: {path}", file=sys.stderr)
+        return {}
+    return data
+
+
+def save_index(path: str, index: Dict[str, Dict[str, Dict[str, object]]]) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
 def main(argv: List[str]) -> int:
-    if len(argv) != 2:
-        print("Usage: create_issues_from_csv.py issues.csv", file=sys.stderr)
+    args = [arg for arg in argv[1:] if arg != "--force"]
+    force = len(args) != len(argv) - 1
+    if len(args) != 1:
+        print("Usage: create_issues_from_csv.py [--force] issues.csv", file=sys.stderr)
         return 2
 
-    csv_path = argv[1]
+    csv_path = args[0]
     if not os.path.exists(csv_path):
         print(f"CSV not found: {csv_path}", file=sys.stderr)
         return 2
 
+    # Rows are independent and network-bound, so overlap their round-trips.
+    # Keep the pool small to stay clear of GitHub's secondary rate limits.
+    try:
+        workers = int(os.environ.get("GH_PARALLEL", "8"))
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        print("GH_PARALLEL must be a positive integer", file=sys.stderr)
+        return 2
+
     label_descriptions = {
         "mvp": "MVP scope",
         "spec": "Language specification and design",
@@ -158,73 +488,167 @@ def main(argv: List[str]) -> int:
         "infra": "Infrastructure and CI",
     }
 
-    results = []
-    created = 0
-    updated = 0
-    failed = 0
-
     try:
-        existing_labels = load_labels()
-        for name, desc in label_descriptions.items():
-            ensure_label(name, desc, existing_labels)
+        repo = resolve_repo()
     except Exception as exc:
-        print(f"Failed to load/create labels: {exc}", file=sys.stderr)
-        return 1
+        print(f"Failed to resolve repository: {exc}", file=sys.stderr)
+        return 2
 
     rows = read_csv(csv_path)
+    full_index = load_index(INDEX_PATH)
+    index = full_index.setdefault(repo, {})
+
+    # Rows imported successfully by an earlier run are skipped unless --force.
+    # Known titles whose body changed still reuse the recorded issue number;
+    # --force ignores those too and looks every title up again.
+    existing_by_title = {}
+    if not force:
+        existing_by_title = {
+            entry["title"]: {"number": entry["number"], "title": entry["title"], "url": entry["url"]}
+            for entry in index.values()
+        }
+    cached_titles = set(existing_by_title)
+    stale_numbers = set()
+    done = set() if force else {(title, body) for title, body in rows if row_key(title, body) in index}
+    pending = [row for row in rows if row not in done]
+    unknown_titles = [title for title, _ in pending if title not in existing_by_title]
+    lookup_errors: Dict[str, str] = {}
+
+    if pending:
+        token = resolve_token()
+        if not token:
+            print("No GitHub token: set GITHUB_TOKEN or log in with `gh auth login`", file=sys.stderr)
+            return 2
+
+        try:
+            gh = GH(token, repo)
+            existing_labels = load_labels(gh)
+            ensure_labels(gh, label_descriptions, existing_labels)
+        except Exception as exc:
+            print(f"Failed to load/create labels: {exc}", file=sys.stderr)
+            return 1
+
+        try:
+            found, lookup_errors = search_issues(gh, unknown_titles)
+            existing_by_title.update(found)
+        except Exception as exc:
+            print(f"Failed to load existing issues: {exc}", file=sys.stderr)
+            return 1
+
     today = dt.date.today().isoformat()
+    comment_prefix = f"Re-imported from issues.csv on {today}\n\n"
+
+    title_locks = {title: threading.Lock() for title, _ in rows}
+
+    def post_comment(issue: Dict[str, str], expanded: str) -> None:
+        gh.request("POST", f"/repos/{gh.repo}/issues/{issue['number']}/comments", {"body": comment_prefix + expanded})
+
+    def process(row: Tuple[str, str]) -> Dict[str, object]:
+        title, body = row
+        if row in done:
+            entry = index[row_key(title, body)]
+            return {
+                "title": title,
+                "action": "skipped",
+                "issue_number": entry["number"],
+                "url": entry["url"],
+                "error": None,
+            }
 
-    for row in rows:
-        title = row["title"]
-        body = row["body"]
         action = "failed"
         issue_number = None
         url = None
         error = None
 
         try:
+            if title in lookup_errors:
+                # Without a lookup we cannot tell whether the issue exists; do not risk a duplicate.
+                raise GitHubError(f"Issue lookup failed: {lookup_errors[title]}")
             label = classify_label(title, body)
             expanded = expand_body(body, title, label)
-            labels = f"mvp,{label}"
-
-            existing = find_existing_issue(title)
-            if existing:
-                issue_number = existing.get("number")
-                url = existing.get("url")
-                comment_body = f"Re-imported from issues.csv on {today}\n\n{expanded}"
-                run_gh(["issue", "comment", str(issue_number), "--body", comment_body])
-                action = "updated"
-                updated += 1
-            else:
-                out = run_gh(["issue", "create", "--title", title, "--body", expanded, "--label", labels])
-                url = out.strip()
-                action = "created"
-                created += 1
+            labels = ["mvp", label]
+
+            # Rows sharing a title run one at a time, so a later row sees the
+            # issue an earlier one created and comments on it instead.
+            with title_locks[title]:
+                existing = find_existing_issue(title, existing_by_title)
+                if existing:
+                    try:
+                        post_comment(existing, expanded)
+                    except GitHubError as exc:
+                        if exc.status not in STALE_ISSUE_STATUSES or title not in cached_titles:
+                            raise
+                        # The indexed issue was deleted or moved away; forget it and search again.
+                        stale_numbers.add(existing["number"])
+                        cached_titles.discard(title)
+                        del existing_by_title[title]
+                        found, failed = search_issues(gh, [title])
+                        if title in failed:
+                            raise GitHubError(f"Issue lookup failed: {failed[title]}")
+                        existing = found.get(title)
+                        if existing:
+                            existing_by_title[title] = existing
+                            post_comment(existing, expanded)
+                if existing:
+                    issue_number = existing.get("number")
+                    url = existing.get("url")
+                    action = "updated"
+                else:
+                    issue, _ = gh.request(
+                        "POST", f"/repos/{gh.repo}/issues", {"title": title, "body": expanded, "labels": labels}
+                    )
+                    existing_by_title[title] = {"number": issue["number"], "title": title, "url": issue["html_url"]}
+                    issue_number = issue["number"]
+                    url = issue["html_url"]
+                    action = "created"
         except Exception as exc:
-            failed += 1
             error = str(exc)
 
-        results.append(
-            {
-                "title": title,
-                "action": action,
-                "issue_number": issue_number,
-                "url": url,
-                "error": error,
-            }
-        )
+        return {
+            "title": title,
+            "action": action,
+            "issue_number": issue_number,
+            "url": url,
+            "error": error,
+        }
 
-    os.makedirs("artifacts", exist_ok=True)
-    with open("artifacts/issues_import_log.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    counts = {"created": 0, "updated": 0, "skipped": 0, "failed": 0}
+    failures = []
+    recorded = set()
 
-    print(f"Created: {created}")
-    print(f"Updated: {updated}")
+    # One JSON object per line, flushed as rows finish, so a crash keeps what was done.
+    os.makedirs("artifacts", exist_ok=True)
+    with open("artifacts/issues_import_log.jsonl", "w", encoding="utf-8") as log:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            for (title, body), result in zip(rows, ex.map(process, rows)):
+                log.write(json.dumps(result, separators=(",", ":")) + "\n")
+                log.flush()
+                counts[result["action"]] += 1
+                if result["action"] == "failed":
+                    failures.append((result["title"], result["error"]))
+                elif result["action"] != "skipped":
+                    recorded.add(row_key(title, body))
+                    index[row_key(title, body)] = {
+                        "title": title,
+                        "number": result["issue_number"],
+                        "url": result["url"],
+                        "last_action": result["action"],
+                        "ts": dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+                    }
+
+    # Drop older entries pointing at issues found to be deleted or moved this run.
+    for key in [key for key, entry in index.items() if entry["number"] in stale_numbers and key not in recorded]:
+        del index[key]
+    save_index(INDEX_PATH, full_index)
+
+    failed = counts["failed"]
+    print(f"Created: {counts['created']}")
+    print(f"Updated: {counts['updated']}")
+    print(f"Skipped: {counts['skipped']}")
     if failed:
         print(f"Failed: {failed}")
-        for item in results:
-            if item["action"] == "failed":
-                print(f"- {item['title']}: {item['error']}")
+        for title, error in failures:
+            print(f"- {title}: {error}")
     else:
         print("Failed: 0")
 